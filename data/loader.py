@@ -136,7 +136,7 @@ class QuarterlyDataCollector:
            column: 'thstrm_amount'(당기금액) 또는 'thstrm_add_amount'(당기누계)"""
         def find_amount(keywords):
             for keyword in keywords:
-                rows = df[df['account_nm'].str.contains(keyword, case=False, na=False)]
+                rows = df[df['account_nm'].str.contains(keyword, case=False, na=False, regex=False)]
                 if not rows.empty:
                     try:
                         raw = rows.iloc[0].get(column, '0')
@@ -279,7 +279,7 @@ class QuarterlyDataCollector:
         
         def find_amount(keywords):
             for keyword in keywords:
-                rows = df[df['account_nm'].str.contains(keyword, case=False, na=False)]
+                rows = df[df['account_nm'].str.contains(keyword, case=False, na=False, regex=False)]
                 if not rows.empty:
                     try:
                         return float(str(rows.iloc[0]['thstrm_amount']).replace(',', '').replace('-', '0'))
@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
+import re
 import pandas as pd
 from data.loader import DartAPICollector
 
+# 비율/점수/금액 단위가 붙은 지표 행 판별용 (모듈 로드 시 1회 컴파일)
+_RATIO_UNIT_RE = re.compile('%|점|억원')
+
 def prepare_chart_data(df: pd.DataFrame):
     """재무 데이터를 Plotly 차트용 long-format 데이터로 변환"""
     if df is None or df.empty:
         return pd.DataFrame()
     
-    ratio_data = df[df['구분'].str.contains('%|점|억원', na=False)].copy()
+    ratio_data = df[df['구분'].str.contains(_RATIO_UNIT_RE, na=False)].copy()
     companies = [col for col in ratio_data.columns if col != '구분' and not col.endswith('_원시값')]
     
     chart_data_list = []
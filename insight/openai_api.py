@@ -1,19 +1,18 @@
 # -*- coding: utf-8 -*-
+import importlib.util
 import streamlit as st
 import pandas as pd
 import config
 
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# openai 패키지는 import 비용이 크므로 설치 여부만 확인하고, 실제 import는 클라이언트 생성 시 수행
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
 class OpenAIInsightGenerator:
     """OpenAI GPT-4o를 사용하여 분석 인사이트를 생성하는 클래스"""
     def __init__(self, api_key):
         if OPENAI_AVAILABLE and api_key:
             try:
+                from openai import OpenAI
                 self.client = OpenAI(api_key=api_key)
                 self.model = "gpt-4o"
             except Exception as e:
@@ -189,7 +188,7 @@ class OpenAIInsightGenerator:
             news_df['회사'] = news_df['제목'].apply(self._extract_company_from_title)
         
         # SK 관련 뉴스 제외하고 경쟁사 뉴스만 선택
-        competitor_news = news_df[~news_df['회사'].astype(str).str.contains("SK", na=False)].head(10)
+        competitor_news = news_df[~news_df['회사'].astype(str).str.contains("SK", na=False, regex=False)].head(10)
         
         if competitor_news.empty:
             return "분석할 경쟁사의 최신 뉴스가 없습니다."
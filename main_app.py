@@ -16,12 +16,12 @@ from visualization.charts import (
 # ✅ export 모듈 import 수정 - PDF만 언급
 try:
     # 현재 디렉토리에 export.py가 있는 경우
-    from util.export import generate_pdf_report, create_excel_report, handle_pdf_generation_button
+    from util.export import generate_pdf_report, create_excel_report, handle_pdf_generation_button, handle_all_reports_button
     EXPORT_AVAILABLE = True
 except ImportError:
     try:
         # util 폴더에 있는 경우
-        from util.export import generate_pdf_report, create_excel_report, handle_pdf_generation_button
+        from util.export import generate_pdf_report, create_excel_report, handle_pdf_generation_button, handle_all_reports_button
         EXPORT_AVAILABLE = True
     except ImportError as e:
         # import 실패 시 대체 함수들 생성
@@ -34,6 +34,10 @@ except ImportError:
         def handle_pdf_generation_button(*args, **kwargs):
             st.error("❌ PDF 생성 기능을 사용할 수 없습니다.")
             return False
+        
+        def handle_all_reports_button(*args, **kwargs):
+            st.error("❌ 보고서 생성 기능을 사용할 수 없습니다.")
+            return False
             
         EXPORT_AVAILABLE = False
         st.error(f"❌ PDF 생성 모듈 로드 실패: {e}")
@@ -230,6 +234,8 @@ class SessionManager:
         st.session_state[data_type] = data
         if insight_type:
             st.session_state[insight_type] = data
+        # 보고서용 세션 데이터 스냅샷 무효화 (util.export.get_real_data_from_session)
+        st.session_state['_data_version'] = st.session_state.get('_data_version', 0) + 1
         st.session_state.last_analysis_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # 분석 상태 업데이트
@@ -543,7 +549,7 @@ def render_financial_results():
         fixed_items = ['고정비', '인건비', '임차료', '관리비', '고정비율(%)']
         fixed_df = final_df[final_df['구분'].isin(fixed_items) | 
                            (final_df['구분'].str.startswith('  └') & 
-                            ~final_df['구분'].str.contains('감가상각비'))]
+                            ~final_df['구분'].str.contains('감가상각비', regex=False))]
         if not fixed_df.empty:
             st.dataframe(
                 fixed_df[display_cols].set_index('구분'), 
@@ -629,14 +635,14 @@ def render_financial_results():
         # 분기별 데이터 테이블 표시
         st.markdown("**📋 분기별 재무지표 상세 데이터**")
         # '연간' 행 제거
-        quarterly_df = quarterly_df[~quarterly_df["분기"].str.contains("연간")]
+        quarterly_df = quarterly_df[~quarterly_df["분기"].str.contains("연간", regex=False)]
         st.dataframe(quarterly_df, use_container_width=True)
         
         if PLOTLY_AVAILABLE:
             # ✅ 분기가 '연간'이 아닌 행만 차트에 사용
             chart_input = quarterly_df.copy()
             if '분기' in chart_input.columns:
-               chart_input = chart_input[~chart_input['분기'].astype(str).str.contains('연간')]
+               chart_input = chart_input[~chart_input['분기'].astype(str).str.contains('연간', regex=False)]
 
             # ✅ 새로운 사용자 지정 트렌드 분석만 사용 (기존 고정 차트 제거)
             st.markdown("---")
@@ -1252,6 +1258,18 @@ def render_report_generation_tab():
                     report_author=report_author.strip() or "AI 분석 시스템",
                     show_footer=show_footer
                 )
+            
+            # ✅ PDF + Excel 함께 생성 (입력 데이터를 한 번만 읽어 두 보고서를 차례로 생성)
+            if st.button("📦 PDF + Excel 함께 생성", key="all_reports_btn"):
+                handle_all_reports_button(
+                    button_clicked=True,
+                    financial_data=financial_data_for_report,
+                    news_data=st.session_state.get('google_news_data'),
+                    insights=collect_all_insights(),
+                    report_target=report_target.strip() or "SK이노베이션 경영진",
+                    report_author=report_author.strip() or "AI 분석 시스템",
+                    show_footer=show_footer
+                )
         else:
             st.warning("⚠️ PDF 생성 기능이 비활성화되어 있습니다.")
             st.info("💡 export.py 파일과 reportlab 패키지를 확인해주세요.")
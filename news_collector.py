@@ -278,6 +278,7 @@ def create_google_news_tab():
                             
                             if insight:
                                 st.session_state.google_news_insight = insight
+                                st.session_state['_data_version'] = st.session_state.get('_data_version', 0) + 1
                             else:
                                 st.error("❌ AI 인사이트 생성에 실패했습니다.")
                                 
@@ -286,6 +287,7 @@ def create_google_news_tab():
                         
                         # 세션에 데이터 저장
                         st.session_state.google_news_data = news_df
+                        st.session_state['_data_version'] = st.session_state.get('_data_version', 0) + 1
                         st.session_state.google_news_query = search_query
                         st.session_state.google_news_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                         
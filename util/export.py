@@ -6,42 +6,124 @@
 
 import io
 import os
+import copy
+import importlib.util
+import hashlib
+import re
+import tempfile
+from xml.sax.saxutils import escape as xml_escape
+from types import MappingProxyType, SimpleNamespace
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
 import streamlit as st
-import matplotlib
-matplotlib.use('Agg')  # ← 반드시 pyplot import 전에
-import matplotlib.pyplot as plt
-
-# 한글 폰트 설정
-plt.rcParams['font.family'] = ['NanumGothic', 'DejaVu Sans', 'sans-serif']
-plt.rcParams['axes.unicode_minus'] = False
-
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib import colors
-    from reportlab.platypus import (
-        Paragraph, Table, TableStyle, Spacer, PageBreak, 
-        Image as RLImage, SimpleDocTemplate, KeepTogether
-    )
-    from reportlab.lib.styles import ParagraphStyle
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    from reportlab.lib.units import inch
-    from reportlab.lib.utils import ImageReader
 
-    REPORTLAB_AVAILABLE = True
-    print("✅ ReportLab 로드 성공")
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    print("❌ ReportLab 없음")
+# ReportLab은 설치 여부만 확인하고 실제 import는 PDF 생성 시점으로 미룸
+# (Streamlit 재실행마다 import util.export 비용을 줄이기 위함 → _ensure_reportlab 참고)
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+# ReportLab 클래스/모듈 모음 - _ensure_reportlab() 최초 호출 시 채워지며 사용처는 _rl.Table처럼 접근
+# (로드 전 접근은 None 호출 대신 어떤 이름이 없는지 드러나는 AttributeError)
+_rl = SimpleNamespace()
+
+# Excel 엔진도 설치 여부만 확인 (xlsxwriter/openpyxl은 Excel 생성 시점에 pandas/함수 내부에서 import)
+XLSXWRITER_AVAILABLE = importlib.util.find_spec("xlsxwriter") is not None
+
+# PDF/Excel 빌드 버퍼를 메모리에 유지할 최대 크기 (초과분은 임시 파일로 기록)
+_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+# 진행 상황 로그 출력 여부 (EXPORT_DEBUG=1일 때만 - 오류/경고 출력은 항상 유지)
+_DEBUG = os.environ.get('EXPORT_DEBUG') == '1'
+
+# 차트 수치 파싱용 단위 제거 정규식 (모듈 로드 시 1회 컴파일)
+_VALUE_UNIT_RE = re.compile(r'조원|억원|[,%]')
 
 # ===========================================
 # 🔧 기본 유틸리티 함수들
 # ===========================================
 
+def _debug_print(message):
+    """보고서 생성 경로의 진행 로그 (Streamlit에서 요청마다 stdout 기록/flush가 반복되지 않도록 기본 비활성)"""
+    if _DEBUG:
+        print(message)
+
+@lru_cache(maxsize=1)
+def _ensure_reportlab():
+    """ReportLab 지연 로드 (최초 1회만 import 후 _rl 네임스페이스에 바인딩, 사용 가능 여부 반환)"""
+    if not REPORTLAB_AVAILABLE:
+        print("❌ ReportLab 없음")
+        return False
+    
+    try:
+        # 차트 Drawing 속성 대입마다 하는 타입 검증 끄기 (EXPORT_DEBUG=1이면 유지)
+        # - reportlab.graphics.shapes가 import 시점에 값을 읽으므로 다른 ReportLab import보다 먼저 설정
+        # - 잘못된 속성 값은 대입 시점이 아니라 렌더링 시점에 오류로 드러남
+        from reportlab import rl_config
+        rl_config.shapeChecking = 1 if _DEBUG else 0
+        
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.platypus import (
+            Paragraph, Table, TableStyle, Spacer, PageBreak, 
+            Image as RLImage, SimpleDocTemplate, KeepTogether
+        )
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.lib.units import inch
+    except ImportError as e:
+        print(f"❌ ReportLab 로드 실패: {e}")
+        return False
+    
+    vars(_rl).update(
+        A4=A4, colors=colors, pdfmetrics=pdfmetrics, TTFont=TTFont, inch=inch,
+        ParagraphStyle=ParagraphStyle, Paragraph=Paragraph, Table=Table,
+        TableStyle=TableStyle, Spacer=Spacer, PageBreak=PageBreak, RLImage=RLImage,
+        SimpleDocTemplate=SimpleDocTemplate, KeepTogether=KeepTogether,
+    )
+    print("✅ ReportLab 로드 성공")
+    return True
+
+@lru_cache(maxsize=1)
+def _get_pyplot():
+    """matplotlib.pyplot 지연 로드 (차트가 필요할 때 1회만 import + 설정)"""
+    import matplotlib
+    matplotlib.use('Agg')  # ← 반드시 pyplot import 전에
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+    
+    # 번들 폰트를 폰트 매니저에 직접 등록 (시스템 폰트 캐시 재탐색/누락 글리프 경고 방지)
+    for font_path in get_font_paths().values():
+        try:
+            font_manager.fontManager.addfont(font_path)
+        except Exception as e:
+            print(f"⚠️ matplotlib 폰트 등록 실패 {font_path}: {e}")
+    
+    # 한글 폰트 설정
+    plt.rcParams['font.family'] = ['NanumGothic', 'DejaVu Sans', 'sans-serif']
+    plt.rcParams['axes.unicode_minus'] = False
+    return plt
+
+def _new_chart_figure(figsize=(10, 6)):
+    """
+    pyplot 상태 머신을 거치지 않는 Figure/Axes 생성
+    - 전역 figure manager 등록/해제 비용 없음, plt.close 불필요
+    - '현재 Figure' 전역 상태를 쓰지 않으므로 차트끼리 서로의 Figure를 건드리지 않음
+    - constrained 레이아웃: 저장(draw) 시 여백을 함께 계산 → 별도 tight_layout 패스 불필요
+    """
+    _get_pyplot()  # Agg 백엔드 + 폰트 설정 보장
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize, facecolor='white', layout='constrained')
+    return fig, fig.add_subplot()
+
+@lru_cache(maxsize=1)
 def get_font_paths():
-    """기존 fonts 폴더의 폰트 경로를 반환"""
+    """기존 fonts 폴더의 폰트 경로를 반환 (프로세스당 1회만 탐색)"""
+    # 폰트 없는 환경(CI, 경량 컨테이너)에서는 파일 탐색 없이 기본 폰트 사용
+    if os.environ.get('SKIP_KOREAN_FONTS') == '1':
+        return MappingProxyType({})
+    
     font_paths = {
         "Korean": "fonts/NanumGothic.ttf",
         "KoreanBold": "fonts/NanumGothicBold.ttf", 
@@ -50,44 +132,110 @@ def get_font_paths():
     
     found_fonts = {}
     for font_name, font_path in font_paths.items():
-        if os.path.exists(font_path):
-            file_size = os.path.getsize(font_path)
-            if file_size > 0:
-                found_fonts[font_name] = font_path
-                print(f"✅ 폰트 발견: {font_name} = {font_path} ({file_size} bytes)")
+        try:
+            file_size = os.stat(font_path).st_size  # exists + getsize 대신 stat 1회
+        except OSError:
+            continue
+        if file_size > 0:
+            found_fonts[font_name] = font_path
+            print(f"✅ 폰트 발견: {font_name} = {font_path} ({file_size} bytes)")
     
-    return found_fonts
+    # 캐시된 결과를 호출자가 수정하지 못하도록 읽기 전용으로 반환
+    return MappingProxyType(found_fonts)
 
+@lru_cache(maxsize=1)
 def register_fonts():
-    """폰트 등록"""
+    """
+    폰트 등록 (최초 1회만 TTF 파싱, 이후 캐시된 결과 반환)
+    - 'Korean'/'KoreanBold' 키는 항상 존재 (TTF가 없으면 Helvetica 계열로 확정) → 호출부는 직접 인덱싱
+    """
     registered_fonts = {"Korean": "Helvetica", "KoreanBold": "Helvetica-Bold"}
     
-    if not REPORTLAB_AVAILABLE:
-        return registered_fonts
+    if not _ensure_reportlab():
+        return MappingProxyType(registered_fonts)
     
     font_paths = get_font_paths()
+    already_registered = set(_rl.pdfmetrics.getRegisteredFontNames())  # 루프마다 목록을 새로 만들지 않도록 1회 조회
     for font_name, font_path in font_paths.items():
         try:
-            if font_name not in pdfmetrics.getRegisteredFontNames():
-                pdfmetrics.registerFont(TTFont(font_name, font_path))
+            if font_name not in already_registered:
+                _rl.pdfmetrics.registerFont(_rl.TTFont(font_name, font_path))
+                already_registered.add(font_name)
             registered_fonts[font_name] = font_name
             print(f"✅ 폰트 등록 성공: {font_name}")
         except Exception as e:
             print(f"❌ 폰트 등록 실패 {font_name}: {e}")
     
-    return registered_fonts
+    # 이후 모든 보고서가 공유하는 캐시 결과 - 호출자가 수정하지 못하도록 읽기 전용으로 반환
+    return MappingProxyType(registered_fonts)
+
+def _fast_df_hash(df):
+    """
+    st.cache_data용 DataFrame 해시 (blake2b over 벡터화된 행 해시)
+    - 객체 그래프 순회 대신 C 레벨 해시 배열을 한 번에 해시
+    - 값이 같아도 컬럼명/dtype이 다르면 다른 키가 되도록 함께 반영
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).values
+    except TypeError:
+        # 셀에 list 등 해시 불가능한 객체가 있으면 문자열로 변환 후 해시
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=True).values
+    
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16)
+    digest.update(repr((list(df.columns), [str(dtype) for dtype in df.dtypes])).encode('utf-8'))
+    return digest.digest()
 
 def safe_str_convert(value):
-    """안전한 문자열 변환"""
+    """
+    안전한 문자열 변환 (str/int/float는 pd.isna 호출 없이 바로 처리)
+    - 단일 값용: DataFrame 컬럼을 테이블로 만들 때는 safe_str_convert_series 사용
+    - 규칙은 safe_str_convert_series와 동일 (결측 → "", 그 외 str() 후 공백 제거)
+    """
+    if value is None:
+        return ""
+    value_type = type(value)
+    if value_type is str:
+        return value.strip()
+    if value_type is float:
+        return "" if value != value else str(value)  # NaN != NaN
+    if value_type is int:
+        return str(value)
+    
+    # list/dict 등 비스칼라 값은 결측 판정 없이 문자열화 (Series 버전의 notna 판정과 동일)
+    if not pd.api.types.is_scalar(value):
+        return str(value).strip()
+    
+    # numpy 스칼라, NaT, pd.NA 등은 기존 방식으로 처리
     try:
         if pd.isna(value):
             return ""
         return str(value).strip()
-    except:
+    except Exception:
         return ""
 
+def safe_str_convert_series(series):
+    """
+    safe_str_convert의 컬럼 단위 버전 (결측 → "", 문자열 변환 후 공백 제거를 셀별 Python 호출 없이 한 번에 처리)
+    - object로 먼저 변환: pandas 3 문자열/숫자 컬럼 모두 결측이 'nan'이 아닌 ""가 되도록
+    """
+    return series.astype(object).where(series.notna(), "").astype(str).str.strip()
+
+def _is_non_empty_df(df):
+    """실제 데이터 여부 (None/비-DataFrame/빈 DataFrame이면 False)"""
+    return isinstance(df, pd.DataFrame) and not df.empty
+
+
 def get_real_data_from_session():
-    """세션 상태에서 실제 데이터 가져오기"""
+    """
+    세션 상태에서 실제 데이터 가져오기
+    - 데이터 저장 시 증가하는 '_data_version'이 같으면 이전 수집 결과를 그대로 반환
+      (재실행마다 키 탐색/출력 반복 방지, 버전이 없으면 매번 수집)
+    """
+    version = st.session_state.get('_data_version')
+    snapshot = st.session_state.get('_export_data_snapshot')
+    if version is not None and snapshot is not None and snapshot[0] == version:
+        return snapshot[1]
+    
     financial_data = None
     news_data = None
     insights = []
@@ -95,14 +243,14 @@ def get_real_data_from_session():
     # 재무 데이터
     if 'financial_data' in st.session_state and st.session_state['financial_data'] is not None:
         financial_data = st.session_state['financial_data']
-        print(f"✅ 세션에서 financial_data 가져옴: {financial_data.shape}")
+        _debug_print(f"✅ 세션에서 financial_data 가져옴: {financial_data.shape}")
     
     # 뉴스 데이터
     news_keys = ['google_news_data', 'news_data']
     for key in news_keys:
         if key in st.session_state and st.session_state[key] is not None:
             news_data = st.session_state[key]
-            print(f"✅ 세션에서 {key} 가져옴: {news_data.shape if hasattr(news_data, 'shape') else len(news_data)}")
+            _debug_print(f"✅ 세션에서 {key} 가져옴: {news_data.shape if hasattr(news_data, 'shape') else len(news_data)}")
             break
     
     # 인사이트 데이터
@@ -115,49 +263,80 @@ def get_real_data_from_session():
             else:
                 insights.append(insight_data)
     
-    print(f"📊 수집된 데이터: 재무={financial_data is not None}, 뉴스={news_data is not None}, 인사이트={len(insights)}개")
+    _debug_print(f"📊 수집된 데이터: 재무={financial_data is not None}, 뉴스={news_data is not None}, 인사이트={len(insights)}개")
+    result = (financial_data, news_data, insights)
+    if version is not None:
+        st.session_state['_export_data_snapshot'] = (version, result)
+    return result
+
+def _resolve_inputs(financial_data, news_data, insights):
+    """보고서 입력 확정 (우선순위: 파라미터 > 세션 상태) - 비어 있는 항목만 세션 값으로 채움"""
+    if financial_data is None or news_data is None or not insights:
+        session_financial, session_news, session_insights = get_real_data_from_session()
+        if financial_data is None:
+            financial_data = session_financial
+        if news_data is None:
+            news_data = session_news
+        if not insights:
+            insights = session_insights
     return financial_data, news_data, insights
 
 # ===========================================
 # 📊 실제 데이터 처리 함수들
 # ===========================================
 
+_METRIC_KEYWORDS = ('매출', '영업이익', 'ROE')
+
+def _metric_row_positions(financial_data):
+    """'구분' 컬럼을 1회만 훑어 지표 키워드별 첫 매칭 행의 위치 반환 (없으면 None)"""
+    positions = dict.fromkeys(_METRIC_KEYWORDS)
+    if '구분' not in financial_data.columns:
+        return positions
+    
+    for pos, label in enumerate(financial_data['구분'].tolist()):
+        if not isinstance(label, str):
+            continue
+        for keyword in _METRIC_KEYWORDS:
+            if positions[keyword] is None and keyword in label:
+                positions[keyword] = pos
+    return positions
+
+def _parse_metric_values(financial_data, row_pos, companies):
+    """지표 행의 회사별 값을 숫자 배열로 일괄 변환 (단위 제거, 변환 실패는 0)"""
+    # 행 전체를 꺼낸 뒤 회사 컬럼을 고르지 않고, 필요한 셀만 위치로 바로 선택
+    raw = financial_data.iloc[row_pos, financial_data.columns.get_indexer(companies)]
+    cleaned = safe_str_convert_series(raw).str.replace(_VALUE_UNIT_RE, '', regex=True).str.strip()
+    return pd.to_numeric(cleaned, errors='coerce').fillna(0).to_numpy(dtype=float)
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: _fast_df_hash})
 def generate_real_summary(financial_data):
-    """실제 재무 데이터 기반 요약 생성"""
-    if financial_data is None or financial_data.empty:
+    """
+    실제 재무 데이터 기반 요약 생성
+    - financial_data 값/컬럼/dtype 해시 기준 캐시: 뉴스·인사이트·작성자 등 다른 입력만 바뀌어
+      PDF가 다시 빌드될 때도 요약은 재계산하지 않음 (데이터가 바뀌면 해시가 달라져 자동 무효화)
+    """
+    if not _is_non_empty_df(financial_data):
         return "실제 재무 데이터가 제공되지 않았습니다."
     
     try:
-        # SK에너지 컬럼 찾기
-        sk_col = None
-        for col in financial_data.columns:
+        # SK에너지 컬럼 찾기 (중복 컬럼명이 있어도 셀을 바로 읽도록 위치로 보관)
+        sk_col_pos = None
+        for col_pos, col in enumerate(financial_data.columns):
             if 'SK' in col and col != '구분':
-                sk_col = col
+                sk_col_pos = col_pos
                 break
         
-        if sk_col is None:
+        if sk_col_pos is None:
             return f"SK에너지 데이터를 찾을 수 없습니다. (컬럼: {list(financial_data.columns)})"
         
-        # 주요 지표 추출
+        # 주요 지표 추출 ('구분' 컬럼은 한 번만 스캔, SK 컬럼은 필요한 셀만 변환)
         summary_parts = []
+        positions = _metric_row_positions(financial_data)
         
-        # 매출액
-        revenue_row = financial_data[financial_data['구분'].str.contains('매출', na=False)]
-        if not revenue_row.empty:
-            revenue = safe_str_convert(revenue_row.iloc[0][sk_col])
-            summary_parts.append(f"매출액 {revenue}")
-        
-        # 영업이익률
-        profit_row = financial_data[financial_data['구분'].str.contains('영업이익률|영업이익', na=False)]
-        if not profit_row.empty:
-            profit = safe_str_convert(profit_row.iloc[0][sk_col])
-            summary_parts.append(f"영업이익률 {profit}")
-        
-        # ROE
-        roe_row = financial_data[financial_data['구분'].str.contains('ROE', na=False)]
-        if not roe_row.empty:
-            roe = safe_str_convert(roe_row.iloc[0][sk_col])
-            summary_parts.append(f"ROE {roe}")
+        for keyword, label in (('매출', '매출액'), ('영업이익', '영업이익률'), ('ROE', 'ROE')):
+            if positions[keyword] is not None:
+                value = safe_str_convert(financial_data.iat[positions[keyword], sk_col_pos])
+                summary_parts.append(f"{label} {value}")
         
         if summary_parts:
             summary = f"SK에너지는 {', '.join(summary_parts)}를 기록하며 안정적인 성과를 보이고 있습니다. (실제 DART 데이터 기반)"
@@ -170,49 +349,77 @@ def generate_real_summary(financial_data):
         print(f"요약 생성 오류: {e}")
         return f"실제 데이터 분석 중 오류가 발생했습니다: {str(e)}"
 
+# 테이블 종류별 스타일 사양: (헤더 색, 헤더 글자 크기, 본문 글자 크기, 헤더 하단 여백, 본문 배경색, 세로 가운데 정렬)
+_TABLE_STYLE_SPECS = {
+    'financial': ('#E31E24', 9, 8, 8, 'beige', True),
+    'sample_financial': ('#E31E24', 10, 9, 12, 'beige', False),
+    'news': ('#4CAF50', 10, 8, 12, 'lightgrey', True),
+}
+
+@lru_cache(maxsize=None)
+def _get_table_style(kind, bold_font, body_font):
+    """
+    테이블 종류 + 폰트 조합별 TableStyle 1회 생성 후 재사용
+    - Table.setStyle은 명령만 복사하므로 같은 TableStyle을 여러 테이블/보고서에서 공유해도 안전
+    """
+    header_color, header_size, body_size, header_padding, body_background, valign = _TABLE_STYLE_SPECS[kind]
+    commands = [
+        ('BACKGROUND', (0, 0), (-1, 0), _rl.colors.HexColor(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), _rl.colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), bold_font),
+        ('FONTNAME', (0, 1), (-1, -1), body_font),
+        ('FONTSIZE', (0, 0), (-1, 0), header_size),
+        ('FONTSIZE', (0, 1), (-1, -1), body_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), header_padding),
+        ('BACKGROUND', (0, 1), (-1, -1), getattr(_rl.colors, body_background)),
+        ('GRID', (0, 0), (-1, -1), 1, _rl.colors.black),
+    ]
+    if valign:
+        commands.append(('VALIGN', (0, 0), (-1, -1), 'MIDDLE'))
+    return _rl.TableStyle(commands)
+
+@lru_cache(maxsize=32)
+def _layout_for(col_count, kind, bold_font, body_font):
+    """
+    컬럼 수별 (컬럼 너비, 공유 TableStyle) - 너비는 컬럼 수로만 결정되므로 행 수/dtype은 키에서 제외
+    """
+    col_width = 6.5 * _rl.inch / col_count if col_count > 0 else 1 * _rl.inch
+    return (col_width,) * col_count, _get_table_style(kind, bold_font, body_font)
+
 def create_real_data_table(financial_data, registered_fonts):
     """실제 재무 데이터 테이블 생성"""
-    if not REPORTLAB_AVAILABLE or financial_data is None or financial_data.empty:
+    if not _ensure_reportlab() or not _is_non_empty_df(financial_data):
         return None
     
     try:
-        # 원시값 컬럼 제외
-        display_cols = [col for col in financial_data.columns if not col.endswith('_원시값')]
+        # 원시값 컬럼 제외 (위치 인덱스로 보관해 컬럼 선택용 DataFrame 복사 생략)
+        col_positions = [i for i, col in enumerate(financial_data.columns) if not col.endswith('_원시값')]
+        display_cols = [financial_data.columns[i] for i in col_positions]
         
         # 테이블 데이터 준비
         table_data = [display_cols]  # 헤더
         
-        # 데이터 행 추가 (최대 10개)
-        for _, row in financial_data.head(10).iterrows():
-            row_data = []
-            for col in display_cols:
-                value = safe_str_convert(row[col])
-                # 긴 텍스트 자르기
-                row_data.append(value[:20] + "..." if len(value) > 20 else value)
-            table_data.append(row_data)
+        # 데이터 행 추가 (최대 10개) - 앞 10행 × 표시 컬럼만 ndarray로 꺼내 한 번에 문자열 변환
+        # (원시값 컬럼까지 object 배열로 변환한 뒤 버리지 않도록 위치 인덱싱을 먼저 적용)
+        block = financial_data.iloc[:10, col_positions].to_numpy(dtype=object)
+        cells = np.char.strip(np.where(pd.isna(block), "", block).astype(str))
+        # 긴 텍스트 자르기 (셀별 분기 대신 배열 단위로 20자 절단 + "...")
+        cells = np.where(np.char.str_len(cells) > 20, np.char.add(cells.astype('<U20'), "..."), cells)
+        table_data.extend(cells.tolist())
         
         if len(table_data) <= 1:  # 헤더만 있는 경우
             return None
         
-        # 컬럼 너비 계산
-        col_count = len(display_cols)
-        col_width = 6.5 * inch / col_count if col_count > 0 else 1 * inch
-        
-        table = Table(table_data, colWidths=[col_width] * col_count)
-        
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E31E24')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), registered_fonts.get('KoreanBold', 'Helvetica-Bold')),
-            ('FONTNAME', (0, 1), (-1, -1), registered_fonts.get('Korean', 'Helvetica')),
-            ('FONTSIZE', (0, 0), (-1, 0), 9),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        # 컬럼 너비 + 헤더 스타일 (같은 컬럼 수면 캐시 재사용)
+        col_widths, table_style = _layout_for(
+            len(display_cols), 'financial',
+            registered_fonts['KoreanBold'], registered_fonts['Korean']
+        )
+        
+        table = _rl.Table(table_data, colWidths=col_widths, repeatRows=1)
+        
+        table.setStyle(table_style)
         
         return table
         
@@ -224,16 +431,11 @@ def create_real_data_charts(financial_data):
     """실제 재무 데이터 차트 생성"""
     charts = {}
     
-    if financial_data is None or financial_data.empty:
+    if not _is_non_empty_df(financial_data):
         print("⚠️ 실제 데이터 없음, 샘플 차트 사용")
         return create_sample_charts()
     
     try:
-        # matplotlib 한글 폰트 설정
-        font_paths = get_font_paths()
-        if "Korean" in font_paths:
-            plt.rcParams['font.family'] = ['NanumGothic']
-        
         # 회사 컬럼 찾기 (구분 제외)
         company_cols = [col for col in financial_data.columns 
                        if col != '구분' and not col.endswith('_원시값')]
@@ -242,25 +444,16 @@ def create_real_data_charts(financial_data):
             print("⚠️ 회사 컬럼 없음, 샘플 차트 사용")
             return create_sample_charts()
         
-        print(f"📊 실제 데이터 차트 생성: {company_cols}")
+        _debug_print(f"📊 실제 데이터 차트 생성: {company_cols}")
+        positions = _metric_row_positions(financial_data)
+        companies = company_cols[:4]  # 최대 4개 회사
         
         # 1. 매출 비교 차트
-        revenue_row = financial_data[financial_data['구분'].str.contains('매출', na=False)]
-        if not revenue_row.empty:
-            fig1, ax1 = plt.subplots(figsize=(10, 6))
-            fig1.patch.set_facecolor('white')
-            
-            companies = company_cols[:4]  # 최대 4개 회사
-            revenues = []
+        if positions['매출'] is not None:
+            fig1, ax1 = _new_chart_figure()
             
-            for company in companies:
-                try:
-                    value_str = safe_str_convert(revenue_row.iloc[0][company])
-                    # 숫자 추출 (조원, 억원 등 단위 제거)
-                    clean_value = value_str.replace('조원', '').replace('억원', '').replace(',', '').replace('%', '')
-                    revenues.append(float(clean_value))
-                except:
-                    revenues.append(0)
+            # 숫자 추출 (조원, 억원 등 단위 제거)
+            revenues = _parse_metric_values(financial_data, positions['매출'], companies)
             
             colors_list = ['#E31E24', '#FF6B6B', '#4ECDC4', '#45B7D1'][:len(companies)]
             
@@ -275,26 +468,16 @@ def create_real_data_charts(financial_data):
                 ax1.text(bar.get_x() + bar.get_width()/2., height + max(revenues)*0.01,
                         f'{value:.1f}', ha='center', va='bottom', fontsize=11, weight='bold')
             
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
+            ax1.tick_params(axis='x', labelrotation=45)
+            for label in ax1.get_xticklabels():
+                label.set_horizontalalignment('right')
             charts['revenue_comparison'] = fig1
         
         # 2. ROE 비교 차트
-        roe_row = financial_data[financial_data['구분'].str.contains('ROE', na=False)]
-        if not roe_row.empty:
-            fig2, ax2 = plt.subplots(figsize=(10, 6))
-            fig2.patch.set_facecolor('white')
-            
-            companies = company_cols[:4]
-            roe_values = []
+        if positions['ROE'] is not None:
+            fig2, ax2 = _new_chart_figure()
             
-            for company in companies:
-                try:
-                    value_str = safe_str_convert(roe_row.iloc[0][company])
-                    clean_value = value_str.replace('%', '').replace(',', '')
-                    roe_values.append(float(clean_value))
-                except:
-                    roe_values.append(0)
+            roe_values = _parse_metric_values(financial_data, positions['ROE'], companies)
             
             bars = ax2.bar(companies, roe_values, color='#E31E24', alpha=0.7)
             ax2.set_title('ROE 비교 (실제 DART 데이터)', fontsize=14, pad=20, weight='bold')
@@ -308,71 +491,85 @@ def create_real_data_charts(financial_data):
                     ax2.text(bar.get_x() + bar.get_width()/2., height + max(roe_values)*0.01,
                             f'{value:.1f}%', ha='center', va='bottom', fontsize=11, weight='bold')
             
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
+            ax2.tick_params(axis='x', labelrotation=45)
+            for label in ax2.get_xticklabels():
+                label.set_horizontalalignment('right')
             charts['roe_comparison'] = fig2
         
-        print(f"✅ 실제 데이터 차트 생성 완료: {list(charts.keys())}")
+        _debug_print(f"✅ 실제 데이터 차트 생성 완료: {list(charts.keys())}")
         return charts if charts else create_sample_charts()
         
     except Exception as e:
         print(f"❌ 실제 데이터 차트 생성 실패: {e}")
         return create_sample_charts()
 
+# 뉴스 컬럼 역할별 키워드 (앞선 역할이 우선, 한 컬럼은 하나의 역할만 가짐)
+_NEWS_COLUMN_KEYWORDS = (
+    ('title', ('제목', 'title', 'headline')),
+    ('date', ('날짜', 'date', 'published')),
+    ('source', ('출처', 'source', 'publisher')),
+)
+
+@lru_cache(maxsize=32)
+def _find_news_columns(columns):
+    """뉴스 컬럼명 튜플 → (제목, 날짜, 출처) 컬럼 (없으면 None)"""
+    found = dict.fromkeys(role for role, _ in _NEWS_COLUMN_KEYWORDS)
+    for col in columns:
+        col_lower = str(col).lower()  # 컬럼당 1회만 소문자 변환
+        for role, keywords in _NEWS_COLUMN_KEYWORDS:
+            if found[role] is None and any(keyword in col_lower for keyword in keywords):
+                found[role] = col
+                break
+    return found['title'], found['date'], found['source']
+
 def create_real_news_table(news_data, registered_fonts):
     """실제 뉴스 데이터 테이블 생성"""
-    if not REPORTLAB_AVAILABLE or news_data is None or news_data.empty:
+    if not _ensure_reportlab() or not _is_non_empty_df(news_data):
         return create_sample_news_table(registered_fonts)
     
     try:
-        print(f"📰 실제 뉴스 데이터 처리: {news_data.shape}")
+        _debug_print(f"📰 실제 뉴스 데이터 처리: {news_data.shape}")
         
-        # 뉴스 컬럼 찾기
-        title_col = date_col = source_col = None
+        # 뉴스 컬럼 찾기 (동일 컬럼 구성은 캐시 재사용)
+        title_col, date_col, source_col = _find_news_columns(tuple(news_data.columns))
         
-        for col in news_data.columns:
-            col_lower = col.lower()
-            if title_col is None and ('제목' in col or 'title' in col_lower or 'headline' in col_lower):
-                title_col = col
-            elif date_col is None and ('날짜' in col or 'date' in col_lower or 'published' in col_lower):
-                date_col = col
-            elif source_col is None and ('출처' in col or 'source' in col_lower or 'publisher' in col_lower):
-                source_col = col
-        
-        print(f"📰 컬럼 매핑: 제목={title_col}, 날짜={date_col}, 출처={source_col}")
+        _debug_print(f"📰 컬럼 매핑: 제목={title_col}, 날짜={date_col}, 출처={source_col}")
         
         # 테이블 데이터 준비
         table_data = [['제목', '날짜', '출처']]
         
-        # 뉴스 데이터 추가 (최대 5개)
-        for idx, row in news_data.head(5).iterrows():
-            title = safe_str_convert(row[title_col] if title_col else f"뉴스 #{idx+1}")[:50]
-            date = safe_str_convert(row[date_col] if date_col else "날짜 없음")
-            source = safe_str_convert(row[source_col] if source_col else "출처 없음")
-            
-            table_data.append([title, date, source])
+        # 뉴스 데이터 추가 (최대 5개) - 행 순회 대신 컬럼 단위로 한 번에 추출
+        head = news_data.head(5)
+        row_count = len(head)
+        
+        def column_values(col, default, max_len=None):
+            if col is None:
+                return [default] * row_count
+            # 셀별 safe_str_convert 호출 대신 safe_str_convert_series로 컬럼 전체 변환
+            values = safe_str_convert_series(head[col])
+            if max_len is not None:
+                values = values.str.slice(0, max_len)
+            return values.tolist()
+        
+        # 제목 컬럼이 없으면 인덱스 라벨 대신 위치 기반 번호 사용 (문자열 인덱스에서도 안전)
+        if title_col is None:
+            titles = [f"뉴스 #{i}" for i in range(1, row_count + 1)]
+        else:
+            titles = column_values(title_col, "", max_len=50)
+        dates = column_values(date_col, "날짜 없음")
+        sources = column_values(source_col, "출처 없음")
+        
+        table_data.extend([title, date, source] for title, date, source in zip(titles, dates, sources))
         
         if len(table_data) <= 1:
             return create_sample_news_table(registered_fonts)
         
-        col_widths = [3.5*inch, 1.5*inch, 1.5*inch]
-        table = Table(table_data, colWidths=col_widths)
-        
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), registered_fonts.get('KoreanBold', 'Helvetica-Bold')),
-            ('FONTNAME', (0, 1), (-1, -1), registered_fonts.get('Korean', 'Helvetica')),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        
-        print(f"✅ 실제 뉴스 테이블 생성: {len(table_data)-1}개 뉴스")
+        col_widths = [3.5*_rl.inch, 1.5*_rl.inch, 1.5*_rl.inch]
+        table = _rl.Table(table_data, colWidths=col_widths, repeatRows=1)
+        
+        table.setStyle(_get_table_style('news', registered_fonts['KoreanBold'], registered_fonts['Korean']))
+        
+        _debug_print(f"✅ 실제 뉴스 테이블 생성: {len(table_data)-1}개 뉴스")
         return table
         
     except Exception as e:
@@ -383,22 +580,23 @@ def create_real_news_table(news_data, registered_fonts):
 # 📊 샘플 데이터 생성 함수들 (폴백용)
 # ===========================================
 
+# 샘플 차트 데이터 (matplotlib / ReportLab 차트 공용)
+_SAMPLE_COMPANIES = ('SK에너지', 'S-Oil', 'GS칼텍스', 'HD현대오일뱅크')
+_SAMPLE_REVENUES = (15.2, 14.8, 13.5, 11.2)
+_SAMPLE_ROE_VALUES = (12.3, 11.8, 10.5, 9.2)
+_REVENUE_BAR_COLORS = ('#E31E24', '#FF6B6B', '#4ECDC4', '#45B7D1')
+
 def create_sample_charts():
     """샘플 차트 생성 (실제 데이터가 없을 때)"""
     charts = {}
     
     try:
-        font_paths = get_font_paths()
-        if "Korean" in font_paths:
-            plt.rcParams['font.family'] = ['NanumGothic']
-        
         # 1. 매출 비교 차트
-        fig1, ax1 = plt.subplots(figsize=(10, 6))
-        fig1.patch.set_facecolor('white')
+        fig1, ax1 = _new_chart_figure()
         
-        companies = ['SK에너지', 'S-Oil', 'GS칼텍스', 'HD현대오일뱅크']
-        revenues = [15.2, 14.8, 13.5, 11.2]
-        colors_list = ['#E31E24', '#FF6B6B', '#4ECDC4', '#45B7D1']
+        companies = list(_SAMPLE_COMPANIES)
+        revenues = list(_SAMPLE_REVENUES)
+        colors_list = list(_REVENUE_BAR_COLORS)
         
         bars = ax1.bar(companies, revenues, color=colors_list, alpha=0.8, width=0.6)
         ax1.set_title('매출액 비교 (샘플 데이터)', fontsize=14, pad=20, weight='bold')
@@ -410,15 +608,15 @@ def create_sample_charts():
             ax1.text(bar.get_x() + bar.get_width()/2., height + 0.2,
                     f'{value}조원', ha='center', va='bottom', fontsize=11, weight='bold')
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        ax1.tick_params(axis='x', labelrotation=45)
+        for label in ax1.get_xticklabels():
+            label.set_horizontalalignment('right')
         charts['revenue_comparison'] = fig1
         
         # 2. ROE 비교 차트
-        fig2, ax2 = plt.subplots(figsize=(10, 6))
-        fig2.patch.set_facecolor('white')
+        fig2, ax2 = _new_chart_figure()
         
-        roe_values = [12.3, 11.8, 10.5, 9.2]
+        roe_values = list(_SAMPLE_ROE_VALUES)
         bars = ax2.bar(companies, roe_values, color='#E31E24', alpha=0.7)
         ax2.set_title('ROE 비교 (샘플 데이터)', fontsize=14, pad=20, weight='bold')
         ax2.set_ylabel('ROE (%)', fontsize=12, weight='bold')
@@ -429,8 +627,9 @@ def create_sample_charts():
             ax2.text(bar.get_x() + bar.get_width()/2., height + 0.2,
                     f'{value}%', ha='center', va='bottom', fontsize=11, weight='bold')
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        ax2.tick_params(axis='x', labelrotation=45)
+        for label in ax2.get_xticklabels():
+            label.set_horizontalalignment('right')
         charts['roe_comparison'] = fig2
         
     except Exception as e:
@@ -440,7 +639,7 @@ def create_sample_charts():
 
 def create_sample_table(registered_fonts):
     """샘플 재무 테이블 생성"""
-    if not REPORTLAB_AVAILABLE:
+    if not _ensure_reportlab():
         return None
     
     try:
@@ -452,23 +651,14 @@ def create_sample_table(registered_fonts):
             ['ROA(%)', '8.1', '7.8', '7.2', '6.5']
         ]
         
-        col_count = len(table_data[0])
-        col_width = 6.5 * inch / col_count
+        col_widths, table_style = _layout_for(
+            len(table_data[0]), 'sample_financial',
+            registered_fonts['KoreanBold'], registered_fonts['Korean']
+        )
         
-        table = Table(table_data, colWidths=[col_width] * col_count)
+        table = _rl.Table(table_data, colWidths=col_widths, repeatRows=1)
         
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E31E24')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), registered_fonts.get('KoreanBold', 'Helvetica-Bold')),
-            ('FONTNAME', (0, 1), (-1, -1), registered_fonts.get('Korean', 'Helvetica')),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(table_style)
         
         return table
         
@@ -478,7 +668,7 @@ def create_sample_table(registered_fonts):
 
 def create_sample_news_table(registered_fonts):
     """샘플 뉴스 테이블 생성"""
-    if not REPORTLAB_AVAILABLE:
+    if not _ensure_reportlab():
         return None
     
     try:
@@ -490,22 +680,10 @@ def create_sample_news_table(registered_fonts):
             ['에너지 전환 정책, 정유업계 영향 분석', '2024-10-22', '이데일리']
         ]
         
-        col_widths = [3.5*inch, 1.5*inch, 1.5*inch]
-        table = Table(news_data, colWidths=col_widths)
-        
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4CAF50')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), registered_fonts.get('KoreanBold', 'Helvetica-Bold')),
-            ('FONTNAME', (0, 1), (-1, -1), registered_fonts.get('Korean', 'Helvetica')),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('FONTSIZE', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        col_widths = [3.5*_rl.inch, 1.5*_rl.inch, 1.5*_rl.inch]
+        table = _rl.Table(news_data, colWidths=col_widths, repeatRows=1)
+        
+        table.setStyle(_get_table_style('news', registered_fonts['KoreanBold'], registered_fonts['Korean']))
         
         return table
         
@@ -513,43 +691,571 @@ def create_sample_news_table(registered_fonts):
         print(f"샘플 뉴스 테이블 생성 실패: {e}")
         return None
 
+def _value_axis_bounds(values, margin=1.15):
+    """막대 차트 값 축 (최소, 최대) - 항상 0을 포함, 값이 모두 0이거나 없으면 (0, 1)"""
+    low = min(0, min(values, default=0)) * margin
+    high = max(0, max(values, default=0)) * margin
+    if low == high:
+        high = 1
+    return low, high
+
+def _native_bar_chart(title, categories, values, label_format, bar_colors,
+                      font_name, bold_font_name, width, height):
+    """ReportLab 기본 차트(VerticalBarChart)로 막대 차트 Drawing 생성 - matplotlib 불필요"""
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    
+    drawing = Drawing(width, height)
+    chart = VerticalBarChart()
+    chart.x, chart.y = 45, 45
+    chart.width, chart.height = width - 65, height - 85
+    chart.data = [tuple(values)]
+    chart.barWidth = 0.6
+    
+    chart.categoryAxis.categoryNames = list(categories)
+    chart.categoryAxis.labels.fontName = font_name
+    chart.categoryAxis.labels.fontSize = 9
+    chart.categoryAxis.labels.angle = 30
+    chart.categoryAxis.labels.boxAnchor = 'ne'
+    
+    # 값 축 범위는 데이터에서 결정 (영업손실/음수 ROE도 Drawing 안에 그려지도록 0을 포함한 양방향 여유)
+    chart.valueAxis.valueMin, chart.valueAxis.valueMax = _value_axis_bounds(values)
+    chart.valueAxis.labels.fontName = font_name
+    chart.valueAxis.labels.fontSize = 8
+    chart.valueAxis.visibleGrid = True
+    chart.valueAxis.gridStrokeColor = _rl.colors.lightgrey
+    
+    chart.barLabelFormat = label_format
+    chart.barLabels.fontName = bold_font_name
+    chart.barLabels.fontSize = 9
+    chart.barLabels.nudge = 8
+    
+    chart.bars.strokeColor = None
+    for i, bar_color in enumerate(bar_colors[:len(values)]):
+        chart.bars[(0, i)].fillColor = _rl.colors.HexColor(bar_color)
+    
+    drawing.add(chart)
+    drawing.add(String(width / 2, height - 18, title, textAnchor='middle',
+                       fontName=bold_font_name, fontSize=12))
+    return drawing
+
+# 샘플 차트 사양 (차트 이름, 제목, 값, 막대 라벨 형식, 막대 색) - 불변 데이터만 모듈에 보관
+_SAMPLE_CHART_SPECS = (
+    ('revenue_comparison', '매출액 비교 (샘플 데이터, 단위: 조원)', _SAMPLE_REVENUES,
+     '%s조원', _REVENUE_BAR_COLORS),
+    ('roe_comparison', 'ROE 비교 (샘플 데이터, 단위: %)', _SAMPLE_ROE_VALUES,
+     '%s%%', ('#E31E24',) * len(_SAMPLE_COMPANIES)),
+)
+
+def _sample_chart_drawings(font_name, bold_font_name, width, height):
+    """
+    샘플 차트를 ReportLab 벡터 Drawing으로 생성 (고정 데이터 차트는 matplotlib 경로 생략)
+    - Drawing은 보고서마다 새로 생성: 렌더링 중 차트 객체 자체(_barPositions 등)가 변경되므로
+      동시에 빌드되는 보고서끼리 공유하면 안 됨 (복사본도 contents의 차트 객체를 공유)
+    """
+    return {
+        name: _native_bar_chart(title, _SAMPLE_COMPANIES, values, label_format, bar_colors,
+                                font_name, bold_font_name, width, height)
+        for name, title, values, label_format, bar_colors in _SAMPLE_CHART_SPECS
+    }
+
+def _real_chart_drawings(financial_data, font_name, bold_font_name, width, height):
+    """
+    실제 재무 데이터 차트를 ReportLab 벡터 Drawing으로 생성 (create_real_data_charts와 같은 지표/회사 기준)
+    - 매 빌드마다 새로 생성하므로 복사 불필요, 지표 행이 없으면 빈 dict (→ matplotlib 경로에서 샘플 폴백)
+    """
+    company_cols = [col for col in financial_data.columns
+                    if col != '구분' and not col.endswith('_원시값')]
+    if not company_cols:
+        return {}
+    
+    positions = _metric_row_positions(financial_data)
+    companies = company_cols[:4]  # 최대 4개 회사
+    drawings = {}
+    
+    if positions['매출'] is not None:
+        revenues = _parse_metric_values(financial_data, positions['매출'], companies)
+        drawings['revenue_comparison'] = _native_bar_chart(
+            '매출액 비교 (실제 DART 데이터)', companies, revenues.tolist(),
+            lambda value: f'{value:.1f}', _REVENUE_BAR_COLORS, font_name, bold_font_name, width, height
+        )
+    
+    if positions['ROE'] is not None:
+        roe_values = _parse_metric_values(financial_data, positions['ROE'], companies)
+        drawings['roe_comparison'] = _native_bar_chart(
+            'ROE 비교 (실제 DART 데이터)', companies, roe_values.tolist(),
+            lambda value: f'{value:.1f}%' if value > 0 else '',
+            ('#E31E24',) * len(companies), font_name, bold_font_name, width, height
+        )
+    
+    return drawings
+
 # ===========================================
 # 🖼️ 차트 이미지 변환
 # ===========================================
 
-def safe_create_chart_image(fig, width=480, height=320):
-    """안전한 차트 이미지 변환 (ImageReader 사용 + DPI 상향)"""
-    if fig is None or not REPORTLAB_AVAILABLE:
+def _fig_to_png(fig, dpi=150):
+    """
+    Figure를 PNG 바이트로 렌더링 (레이아웃은 constrained 레이아웃이 저장 시 적용)
+    - ReportLab이 이미지를 다시 압축하므로 PNG zlib 압축은 최소 레벨로 저장
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=dpi, facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
+    return buf.getvalue()
+
+def _dpi_for(fig, width, height, scale=2):
+    """삽입 크기(pt)의 scale배 픽셀이 바로 나오는 DPI 계산 (렌더링 후 축소 단계 생략)"""
+    fig_w, fig_h = fig.get_size_inches()
+    return max(36, int(min(width * scale / fig_w, height * scale / fig_h)))
+
+@lru_cache(maxsize=1)
+def _get_svg2rlg():
+    """svglib(선택 의존성) 지연 로드 - 없으면 None"""
+    try:
+        from svglib.svglib import svg2rlg
+        return svg2rlg
+    except ImportError:
         return None
+
+def _svg_to_drawing(svg_bytes, width, height):
+    """
+    SVG 바이트 → ReportLab Drawing(벡터) 변환 후 삽입 크기에 맞게 축소
+    - PNG 인코딩/디코딩 없이 PDF에 바로 삽입, 확대해도 선명
+    """
     try:
-        buf = io.BytesIO()
-        # 선명도 확보를 위해 DPI 약간 상향
-        fig.savefig(buf, format='png', bbox_inches='tight', dpi=150, facecolor='white', edgecolor='none')
-        buf.seek(0)
-
-        img_bytes = buf.getvalue()
-        if img_bytes:
-            # ReportLab이 내부적으로 안전하게 들고 있도록 ImageReader로 감싸기
-            reader = ImageReader(io.BytesIO(img_bytes))  # 재읽기 안전
-            img = RLImage(reader, width=width, height=height)
-            plt.close(fig)
-            return img
-
-        plt.close(fig)
+        drawing = _get_svg2rlg()(io.BytesIO(svg_bytes))
+    except Exception as e:
+        print(f"⚠️ SVG 차트 변환 실패: {e}")
+        return None
+    if drawing is None or not drawing.width or not drawing.height:
+        return None
+    
+    scale = min(width / drawing.width, height / drawing.height)
+    drawing.width, drawing.height = drawing.width * scale, drawing.height * scale
+    drawing.scale(scale, scale)
+    return drawing
+
+def _fig_to_image_bytes(fig, width, height):
+    """
+    Figure를 삽입용 이미지 바이트로 렌더링 → (형식, 바이트)
+    - svglib 사용 가능 시 SVG (텍스트는 matplotlib 기본값 svg.fonttype='path'로 패스 저장 → 한글 폰트 불필요)
+    - 그 외에는 삽입 크기에 맞춘 PNG (_dpi_for로 목표 픽셀 크기에 바로 렌더링 → PIL 재디코딩/축소 없음)
+    - SVG 저장/변환에 실패하면 PNG로 대체 (차트가 보고서에서 빠지지 않도록 캐시 전에 변환 가능 여부 확인)
+    """
+    if _get_svg2rlg() is not None:
+        try:
+            buf = io.BytesIO()
+            fig.savefig(buf, format='svg', facecolor='white', edgecolor='none')
+            svg_bytes = buf.getvalue()
+            if _svg_to_drawing(svg_bytes, width, height) is not None:
+                return 'svg', svg_bytes
+        except Exception as e:
+            print(f"⚠️ SVG 차트 저장 실패: {e}")
+        print("⚠️ SVG 변환 불가 → PNG로 대체")
+    return 'png', _fig_to_png(fig, dpi=_dpi_for(fig, width, height))
+
+def _image_flowable(image, width, height):
+    """(형식, 바이트) → PDF 삽입용 flowable (Drawing 또는 RLImage)"""
+    kind, data = image
+    if not data:
+        return None
+    if kind == 'svg':
+        return _svg_to_drawing(data, width, height)
+    # RLImage마다 독립적인 버퍼 전달 (바이트는 캐시 공유)
+    return _rl.RLImage(io.BytesIO(data), width=width, height=height)
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs={pd.DataFrame: _fast_df_hash})
+def _render_chart_images(financial_data, width, height):
+    """
+    차트 생성 + 이미지 렌더링 결과 캐시 (financial_data가 None이면 샘플 차트)
+    - Streamlit 재실행 시 동일 데이터면 재플로팅 생략
+    - Figure 대신 (형식, 바이트)만 캐시에 보관
+    """
+    charts = create_real_data_charts(financial_data) if financial_data is not None else create_sample_charts()
+    
+    if not charts:
+        return {}
+    
+    # 호출 스레드에서 차례로 렌더링 (matplotlib 렌더링은 GIL을 잡는 작업이라 워커 풀 이득이 없고,
+    # st.cache_data 함수 안에서 띄운 워커 스레드에는 스크립트 실행 컨텍스트가 없음)
+    images = {}
+    for chart_name, fig in charts.items():
+        try:
+            images[chart_name] = _fig_to_image_bytes(fig, width, height)
+        except Exception as e:
+            print(f"차트 이미지 렌더링 실패 ({chart_name}): {e}")
+    return images
+
+def safe_create_chart_image(fig, width=480, height=320):
+    """안전한 차트 이미지 변환 (벡터 Drawing 우선, 불가 시 PNG로 렌더링)"""
+    if fig is None or not _ensure_reportlab():
         return None
+    try:
+        return _image_flowable(_fig_to_image_bytes(fig, width, height), width, height)
     except Exception as e:
         print(f"차트 이미지 변환 실패: {e}")
-        try:
-            plt.close(fig)
-        except:
-            pass
         return None
+    finally:
+        # 내부 차트는 pyplot 레지스트리 밖의 Figure라 no-op, 외부에서 plt.subplots로 만든 Figure는 여기서 해제
+        _get_pyplot().close(fig)
+
+
+# ===========================================
+# 📑 PDF 섹션 빌더 (각 섹션의 flowable 목록 반환)
+# ===========================================
+
+@lru_cache(maxsize=256)
+def _parsed_paragraph(text, style):
+    """고정 문구 Paragraph 원본 (텍스트+스타일별 마크업 파싱 1회, 스타일은 _get_styles 캐시 객체라 동일성 해시로 충분)"""
+    return _rl.Paragraph(text, style)
+
+def _static_paragraph(text, style):
+    """
+    고정 문구(섹션 제목, 안내문 등) Paragraph의 얕은 복사본 반환
+    - 레이아웃 상태는 복사본 인스턴스에만 기록되고 파싱 결과(frags)는 읽기만 하므로 공유 가능
+    """
+    return copy.copy(_parsed_paragraph(text, style))
+
+
+def _build_financial_section(section_no, financial_data, has_real_financial,
+                             registered_fonts, heading_style, body_style):
+    """재무분석 섹션 (테이블 + 차트)"""
+    story = []
+    story.append(_static_paragraph(f"{section_no}. 재무분석 결과", heading_style))
+    story.append(_rl.Spacer(1, 10))
+    
+    if has_real_financial:
+        story.append(_static_paragraph("※ 실제 DART에서 수집한 재무 데이터를 기반으로 분석했습니다.", body_style))
+        
+        # 실제 데이터 테이블
+        financial_table = create_real_data_table(financial_data, registered_fonts)
+        if financial_table:
+            story.append(financial_table)
+        else:
+            story.append(_static_paragraph("• 재무 데이터 테이블을 생성할 수 없습니다.", body_style))
+        
+    else:
+        story.append(_static_paragraph("※ 실제 재무 데이터가 제공되지 않아 샘플 데이터를 사용합니다.", body_style))
+        
+        # 샘플 테이블
+        financial_table = create_sample_table(registered_fonts)
+        if financial_table:
+            story.append(financial_table)
+    
+    story.append(_rl.Spacer(1, 16))
+    
+    # 차트 추가
+    # - ReportLab 기본 차트(벡터)로 보고서마다 새로 생성 (샘플 차트는 고정 사양에서 생성)
+    # - 생성 실패/지표 없음이면 matplotlib 렌더링 결과(데이터 해시 기준 캐시)로 폴백
+    chart_width, chart_height = 450, 270
+    chart_flowables = {}
+    try:
+        if has_real_financial:
+            chart_flowables = _real_chart_drawings(
+                financial_data,
+                registered_fonts['Korean'],
+                registered_fonts['KoreanBold'],
+                chart_width, chart_height
+            )
+        else:
+            chart_flowables = _sample_chart_drawings(
+                registered_fonts['Korean'],
+                registered_fonts['KoreanBold'],
+                chart_width, chart_height
+            )
+    except Exception as e:
+        print(f"⚠️ ReportLab 차트 생성 실패, matplotlib으로 대체: {e}")
+    if not chart_flowables:
+        chart_images = _render_chart_images(financial_data if has_real_financial else None,
+                                            chart_width, chart_height)
+        chart_flowables = {
+            chart_name: _image_flowable(image, chart_width, chart_height)
+            for chart_name, image in chart_images.items()
+        }
+    
+    chart_added = False
+    for chart_name, chart_title in [('revenue_comparison', '매출액 비교'), 
+                                   ('roe_comparison', 'ROE 성과 비교')]:
+        if chart_flowables.get(chart_name):
+            chart_img = chart_flowables[chart_name]
+            if chart_img:
+                data_type = "실제 DART 데이터" if has_real_financial else "샘플 데이터"
+                story.append(_static_paragraph(f"▶ {chart_title} ({data_type})", body_style))
+                story.append(chart_img)
+                story.append(_rl.Spacer(1, 10))
+                chart_added = True
+    
+    if not chart_added:
+        story.append(_static_paragraph("📊 차트를 생성할 수 없습니다.", body_style))
+    
+    return story
+
+def _build_news_section(section_no, news_data, registered_fonts, heading_style, body_style):
+    """뉴스 분석 섹션 (뉴스 데이터가 있을 때만 호출)"""
+    story = []
+    story.append(_rl.PageBreak())
+    story.append(_static_paragraph(f"{section_no}. 뉴스 분석 결과", heading_style))
+    story.append(_rl.Spacer(1, 10))
+    story.append(_static_paragraph("※ 실제 수집된 뉴스 데이터를 기반으로 분석했습니다.", body_style))
+    
+    news_table = create_real_news_table(news_data, registered_fonts)
+    if news_table:
+        story.append(news_table)
+    else:
+        story.append(_static_paragraph("📰 뉴스 데이터를 테이블로 변환할 수 없습니다.", body_style))
+    
+    story.append(_rl.Spacer(1, 16))
+    return story
+
+def _build_insights_section(section_no, insights, heading_style, body_style):
+    """AI 인사이트 섹션 (인사이트가 있을 때만 호출)"""
+    # 최대 3개 인사이트의 앞 2개 문단(최대 400자)을 먼저 잘라두고 한 번에 flowable 생성
+    items = [
+        (i, list(_iter_insight_paragraphs(insight)))
+        for i, insight in enumerate(insights[:3], 1)
+        if insight and insight.strip()
+    ]
+    
+    story = [
+        _static_paragraph(f"{section_no}. AI 분석 인사이트", heading_style),
+        _rl.Spacer(1, 10),
+        _static_paragraph("※ AI가 실제 데이터를 분석하여 생성한 인사이트입니다.", body_style),
+        _rl.Spacer(1, 10),
+    ]
+    for i, paras in items:
+        story.extend((_static_paragraph(f"{section_no}-{i}. 인사이트 #{i}", heading_style), _rl.Spacer(1, 6)))
+        story.extend(_rl.Paragraph(para, body_style) for para in paras)
+        story.append(_rl.Spacer(1, 10))
+    
+    return story
+
+# 전략 제언 문구 (고정 텍스트 - 빈 문자열은 문단 간격)
+_STRATEGY_PARAS = (
+    "◆ 단기 전략 (1-2년)",
+    "• 운영 효율성 극대화를 통한 마진 확대에 집중",
+    "• 현금 창출 능력 강화로 안정적 배당 및 투자 재원 확보",
+    "",
+    "◆ 중기 전략 (3-5년)",
+    "• 사업 포트폴리오 다각화 및 신사업 진출 검토",
+    "• 디지털 전환과 공정 혁신을 통한 경쟁력 강화",
+)
 
+# 빈 줄 기준으로 나눈 전략 블록 (블록당 <br/>로 이어 붙인 Paragraph 1개)
+_STRATEGY_BLOCKS = tuple(
+    "<br/>".join(block.split("\n"))
+    for block in "\n".join(_STRATEGY_PARAS).split("\n\n")
+)
+
+def _build_strategy_section(section_no, heading_style, list_style):
+    """전략 제언 섹션 (항상 포함) - 줄마다 Paragraph를 만들지 않고 블록당 1개로 레이아웃"""
+    story = [_static_paragraph(f"{section_no}. 전략 제언", heading_style), _rl.Spacer(1, 10)]
+    for i, block in enumerate(_STRATEGY_BLOCKS):
+        if i:
+            story.append(_rl.Spacer(1, 6))
+        story.append(_static_paragraph(block, list_style))
+    return story
 
 # ===========================================
 # 📄 PDF 보고서 생성 (메인 함수)
 # ===========================================
 
+def _iter_insight_paragraphs(insight, max_paragraphs=2, max_chars=400):
+    """
+    인사이트 앞부분 문단을 단일 패스로 추출
+    - 전체 문자열을 split하지 않고 필요한 문단 수만큼만 탐색
+    - 빈 문단도 개수에 포함 (기존 split()[:2] 동작 유지)
+    - 자른 뒤 XML 이스케이프 (AI 응답의 '<', '&' 때문에 Paragraph 파싱이 실패하지 않도록)
+    """
+    start = 0
+    for _ in range(max_paragraphs):
+        end = insight.find('\n\n', start)
+        stop = len(insight) if end == -1 else end
+        # 문단 전체가 아닌 앞 max_chars자만 복사 (수 MB짜리 응답도 문단당 최대 400자만 할당)
+        head = insight[start:min(stop, start + max_chars)]
+        truncated = stop - start > max_chars
+        if head.strip() or (truncated and insight[start:stop].strip()):
+            # 긴 문단 자르기
+            para = head + "..." if truncated else head
+            yield xml_escape(para.strip())
+        if end == -1:
+            break
+        start = end + 2
+
+@lru_cache(maxsize=None)
+def _get_styles(bold_font, body_font):
+    """폰트 조합별 ParagraphStyle 묶음 생성 (최초 1회 생성 후 재사용, footer 포함)"""
+    title_style = _rl.ParagraphStyle(
+        'Title',
+        fontName=bold_font,
+        fontSize=18,
+        leading=24,
+        spaceAfter=20,
+        alignment=1,
+        textColor=_rl.colors.HexColor('#E31E24')
+    )
+    
+    heading_style = _rl.ParagraphStyle(
+        'Heading',
+        fontName=bold_font,
+        fontSize=14,
+        leading=18,
+        spaceBefore=12,
+        spaceAfter=6,
+        textColor=_rl.colors.HexColor('#E31E24')
+    )
+    
+    body_style = _rl.ParagraphStyle(
+        'Body',
+        fontName=body_font,
+        fontSize=10,
+        leading=14,
+        spaceAfter=6,
+        textColor=_rl.colors.HexColor('#2C3E50')
+    )
+    
+    info_style = _rl.ParagraphStyle(
+        'Info',
+        fontName=body_font,
+        fontSize=12,
+        leading=16,
+        alignment=1,
+        spaceAfter=6
+    )
+    
+    footer_style = _rl.ParagraphStyle(
+        'Footer',
+        fontName=body_font,
+        fontSize=8,
+        alignment=1,
+        textColor=_rl.colors.HexColor('#7F8C8D')
+    )
+    
+    # 여러 줄을 <br/>로 묶은 단일 Paragraph용 - 줄 간격에 원래 문단 간격(spaceAfter)을 합산
+    list_style = _rl.ParagraphStyle('BodyList', parent=body_style, leading=body_style.leading + body_style.spaceAfter)
+    info_block_style = _rl.ParagraphStyle('InfoBlock', parent=info_style, leading=info_style.leading + info_style.spaceAfter)
+    
+    return MappingProxyType({
+        'title': title_style,
+        'heading': heading_style,
+        'body': body_style,
+        'list': list_style,
+        'info': info_style,
+        'info_block': info_block_style,
+        'footer': footer_style,
+    })
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs={pd.DataFrame: _fast_df_hash})
+def _build_pdf_report(
+    financial_data,
+    news_data,
+    insights,
+    report_target,
+    report_author,
+    show_footer,
+    current_date,
+    _footer_ts=None
+):
+    """
+    PDF 바이트 생성 (입력 데이터 기준 캐시)
+    - 동일한 입력으로 재실행되면 ReportLab 빌드 없이 캐시된 결과 반환
+    - _footer_ts는 캐시 키에서 제외 (캐시 적중 시 최초 생성 시각이 그대로 유지됨)
+    """
+    # 1. 데이터 상태 확인
+    has_real_financial = _is_non_empty_df(financial_data)
+    has_real_news = _is_non_empty_df(news_data)
+    has_insights = insights and len(insights) > 0
+    
+    _debug_print(f"📊 데이터 상태: 재무={has_real_financial}, 뉴스={has_real_news}, 인사이트={has_insights}")
+    
+    # 2. 폰트 등록
+    registered_fonts = register_fonts()
+    
+    # 3. 스타일 정의 (폰트 조합별 캐시)
+    styles = _get_styles(
+        registered_fonts['KoreanBold'],
+        registered_fonts['Korean']
+    )
+    title_style, heading_style, body_style = styles['title'], styles['heading'], styles['body']
+    
+    # 4. PDF 문서 생성 (8MB 초과 시 디스크로 넘기는 임시 파일에 직접 기록)
+    #    ReportLab은 페이지 객체를 문서 끝(save)에서 한 번에 기록하므로 중간 flush로 얻는 이득은 없음
+    #    → 출력 대상만 스풀 파일로 두고, 결과는 st.cache_data/download_button이 요구하는 bytes로 반환
+    buffer = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
+    doc = _rl.SimpleDocTemplate(
+        buffer,
+        pagesize=_rl.A4,
+        leftMargin=50,
+        rightMargin=50,
+        topMargin=50,
+        bottomMargin=50
+    )
+    
+    # 제목 / 보고서 정보 / 핵심 요약 헤더
+    story = [
+        _static_paragraph("SK에너지 경쟁사 분석 보고서", title_style),
+        _rl.Spacer(1, 20),
+        _rl.Paragraph(
+            f"보고일자: {current_date}<br/>보고대상: {xml_escape(str(report_target or ''))}<br/>보고자: {xml_escape(str(report_author or ''))}",
+            styles['info_block']
+        ),
+        _rl.Spacer(1, 30),
+        _static_paragraph("◆ 핵심 요약", heading_style),
+        _rl.Spacer(1, 10),
+    ]
+    
+    if has_real_financial:
+        summary_text = generate_real_summary(financial_data)
+    else:
+        summary_text = """SK에너지는 매출액 15.2조원으로 업계 1위를 유지하며, 영업이익률 5.6%와 ROE 12.3%를 기록하여 
+        경쟁사 대비 우수한 성과를 보이고 있습니다. (※ 실제 데이터 미제공으로 샘플 데이터 사용)"""
+    
+    story.extend((_rl.Paragraph(summary_text, body_style), _rl.Spacer(1, 20)))
+    
+    # 섹션별 내용 생성 (순차 생성: 섹션 빌더는 GIL을 잡는 순수 Python 작업이라 스레드 이득이 없고,
+    # 워커 스레드에는 Streamlit 스크립트 실행 컨텍스트가 없음)
+    section_no = 1
+    story.extend(_build_financial_section(section_no, financial_data, has_real_financial,
+                                          registered_fonts, heading_style, body_style))
+    if has_real_news:
+        section_no += 1
+        story.extend(_build_news_section(section_no, news_data, registered_fonts, heading_style, body_style))
+    if has_insights:
+        section_no += 1
+        story.extend(_build_insights_section(section_no, insights, heading_style, body_style))
+    section_no += 1
+    story.extend(_build_strategy_section(section_no, heading_style, styles['list']))
+    
+    # Footer
+    if show_footer:
+        footer_style = styles['footer']
+        story.extend((
+            _rl.Spacer(1, 30),
+            _static_paragraph("※ 본 보고서는 AI 분석 시스템에 의해 생성되었습니다", footer_style),
+            _rl.Paragraph(f"생성일시: {_footer_ts or datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}", footer_style),
+        ))
+    
+    # PDF 빌드
+    doc.build(story)
+    
+    # getvalue() 복사 없이 기록된 크기만큼 한 번에 읽기
+    size = buffer.tell()
+    buffer.seek(0)
+    pdf_data = buffer.read(size)
+    buffer.close()
+    
+    data_status = []
+    if has_real_financial:
+        data_status.append("실제 재무데이터")
+    if has_real_news:
+        data_status.append("실제 뉴스데이터")
+    if has_insights:
+        data_status.append("AI 인사이트")
+    
+    message = f"✅ PDF 생성 완료! ({', '.join(data_status) if data_status else '샘플 데이터'} 사용)"
+    
+    return pdf_data, message
+
 def generate_pdf_report(
     financial_data=None,
     news_data=None,
@@ -568,9 +1274,9 @@ def generate_pdf_report(
     - 세션 상태에서 자동 데이터 수집
     - 폴백으로 샘플 데이터 사용
     """
-    print(f"🚀 PDF 보고서 생성 시작")
+    _debug_print(f"🚀 PDF 보고서 생성 시작")
     
-    if not REPORTLAB_AVAILABLE:
+    if not _ensure_reportlab():
         return {
             'success': False,
             'data': None,
@@ -579,250 +1285,28 @@ def generate_pdf_report(
     
     try:
         # 1. 데이터 수집 우선순위: 파라미터 > 세션 상태 > 샘플
-        if financial_data is None or news_data is None or not insights:
-            session_financial, session_news, session_insights = get_real_data_from_session()
-            
-            if financial_data is None:
-                financial_data = session_financial
-            if news_data is None:
-                news_data = session_news
-            if not insights:
-                insights = session_insights
-        
-        # 2. 데이터 상태 확인
-        has_real_financial = (financial_data is not None and 
-                             not (hasattr(financial_data, 'empty') and financial_data.empty))
-        has_real_news = (news_data is not None and 
-                        not (hasattr(news_data, 'empty') and news_data.empty))
-        has_insights = insights and len(insights) > 0
-        
-        print(f"📊 데이터 상태: 재무={has_real_financial}, 뉴스={has_real_news}, 인사이트={has_insights}")
-        
-        # 3. 폰트 등록
-        registered_fonts = register_fonts()
-        
-        # 4. 스타일 정의
-        title_style = ParagraphStyle(
-            'Title',
-            fontName=registered_fonts.get('KoreanBold', 'Helvetica-Bold'),
-            fontSize=18,
-            leading=24,
-            spaceAfter=20,
-            alignment=1,
-            textColor=colors.HexColor('#E31E24')
-        )
-        
-        heading_style = ParagraphStyle(
-            'Heading',
-            fontName=registered_fonts.get('KoreanBold', 'Helvetica-Bold'),
-            fontSize=14,
-            leading=18,
-            spaceBefore=12,
-            spaceAfter=6,
-            textColor=colors.HexColor('#E31E24')
-        )
-        
-        body_style = ParagraphStyle(
-            'Body',
-            fontName=registered_fonts.get('Korean', 'Helvetica'),
-            fontSize=10,
-            leading=14,
-            spaceAfter=6,
-            textColor=colors.HexColor('#2C3E50')
-        )
-        
-        info_style = ParagraphStyle(
-            'Info',
-            fontName=registered_fonts.get('Korean', 'Helvetica'),
-            fontSize=12,
-            leading=16,
-            alignment=1,
-            spaceAfter=6
-        )
-        
-        # 5. PDF 문서 생성
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            leftMargin=50,
-            rightMargin=50,
-            topMargin=50,
-            bottomMargin=50
+        financial_data, news_data, insights = _resolve_inputs(financial_data, news_data, insights)
+        
+        # 2. PDF 생성 (동일 입력이면 캐시 재사용) - 보고일자/생성일시/파일명은 같은 시각 기준
+        now = datetime.now()
+        current_date = now.strftime('%Y년 %m월 %d일')
+        footer_ts = now.strftime('%Y년 %m월 %d일 %H시 %M분')
+        file_ts = now.strftime('%Y%m%d_%H%M%S')
+        pdf_data, message = _build_pdf_report(
+            financial_data,
+            news_data,
+            insights,
+            report_target,
+            report_author,
+            show_footer,
+            current_date,
+            _footer_ts=footer_ts
         )
         
-        story = []
-        
-        # 제목
-        story.append(Paragraph("SK에너지 경쟁사 분석 보고서", title_style))
-        story.append(Spacer(1, 20))
-        
-        # 보고서 정보
-        current_date = datetime.now().strftime('%Y년 %m월 %d일')
-        story.append(Paragraph(f"보고일자: {current_date}", info_style))
-        story.append(Paragraph(f"보고대상: {report_target}", info_style))
-        story.append(Paragraph(f"보고자: {report_author}", info_style))
-        story.append(Spacer(1, 30))
-        
-        # 핵심 요약
-        story.append(Paragraph("◆ 핵심 요약", heading_style))
-        story.append(Spacer(1, 10))
-        
-        if has_real_financial:
-            summary_text = generate_real_summary(financial_data)
-        else:
-            summary_text = """SK에너지는 매출액 15.2조원으로 업계 1위를 유지하며, 영업이익률 5.6%와 ROE 12.3%를 기록하여 
-            경쟁사 대비 우수한 성과를 보이고 있습니다. (※ 실제 데이터 미제공으로 샘플 데이터 사용)"""
-        
-        story.append(Paragraph(summary_text, body_style))
-        story.append(Spacer(1, 20))
-        
-        # 섹션별 내용 생성
-        section_counter = 1
-        
-        # 재무분석 섹션
-        story.append(Paragraph(f"{section_counter}. 재무분석 결과", heading_style))
-        story.append(Spacer(1, 10))
-        
-        if has_real_financial:
-            story.append(Paragraph("※ 실제 DART에서 수집한 재무 데이터를 기반으로 분석했습니다.", body_style))
-            
-            # 실제 데이터 테이블
-            financial_table = create_real_data_table(financial_data, registered_fonts)
-            if financial_table:
-                story.append(financial_table)
-            else:
-                story.append(Paragraph("• 재무 데이터 테이블을 생성할 수 없습니다.", body_style))
-            
-            # 실제 데이터 차트
-            charts = create_real_data_charts(financial_data)
-        else:
-            story.append(Paragraph("※ 실제 재무 데이터가 제공되지 않아 샘플 데이터를 사용합니다.", body_style))
-            
-            # 샘플 테이블
-            financial_table = create_sample_table(registered_fonts)
-            if financial_table:
-                story.append(financial_table)
-            
-            # 샘플 차트
-            charts = create_sample_charts()
-        
-        story.append(Spacer(1, 16))
-        
-        # 차트 추가
-        chart_added = False
-        for chart_name, chart_title in [('revenue_comparison', '매출액 비교'), 
-                                       ('roe_comparison', 'ROE 성과 비교')]:
-            if charts.get(chart_name):
-                chart_img = safe_create_chart_image(charts[chart_name], width=450, height=270)
-                if chart_img:
-                    data_type = "실제 DART 데이터" if has_real_financial else "샘플 데이터"
-                    story.append(Paragraph(f"▶ {chart_title} ({data_type})", body_style))
-                    story.append(chart_img)
-                    story.append(Spacer(1, 10))
-                    chart_added = True
-        
-        if not chart_added:
-            story.append(Paragraph("📊 차트를 생성할 수 없습니다.", body_style))
-        
-        section_counter += 1
-        
-        # 뉴스 분석 섹션 (뉴스 데이터가 있을 때만)
-        if has_real_news:
-            story.append(PageBreak())
-            story.append(Paragraph(f"{section_counter}. 뉴스 분석 결과", heading_style))
-            story.append(Spacer(1, 10))
-            story.append(Paragraph("※ 실제 수집된 뉴스 데이터를 기반으로 분석했습니다.", body_style))
-            
-            news_table = create_real_news_table(news_data, registered_fonts)
-            if news_table:
-                story.append(news_table)
-            else:
-                story.append(Paragraph("📰 뉴스 데이터를 테이블로 변환할 수 없습니다.", body_style))
-            
-            story.append(Spacer(1, 16))
-            section_counter += 1
-        
-        # AI 인사이트 섹션 (인사이트가 있을 때만)
-        if has_insights:
-            story.append(Paragraph(f"{section_counter}. AI 분석 인사이트", heading_style))
-            story.append(Spacer(1, 10))
-            story.append(Paragraph("※ AI가 실제 데이터를 분석하여 생성한 인사이트입니다.", body_style))
-            story.append(Spacer(1, 10))
-            
-            for i, insight in enumerate(insights[:3], 1):  # 최대 3개 인사이트
-                if insight and insight.strip():
-                    story.append(Paragraph(f"{section_counter}-{i}. 인사이트 #{i}", heading_style))
-                    story.append(Spacer(1, 6))
-                    
-                    # 인사이트를 문단별로 분할
-                    insight_paragraphs = insight.split('\n\n')
-                    for para in insight_paragraphs[:2]:  # 최대 2개 문단
-                        if para.strip():
-                            # 긴 문단 자르기
-                            if len(para) > 400:
-                                para = para[:400] + "..."
-                            story.append(Paragraph(para.strip(), body_style))
-                    story.append(Spacer(1, 10))
-            
-            section_counter += 1
-        
-        # 전략 제언 (항상 포함)
-        story.append(Paragraph(f"{section_counter}. 전략 제언", heading_style))
-        story.append(Spacer(1, 10))
-        
-        strategy_content = [
-            "◆ 단기 전략 (1-2년)",
-            "• 운영 효율성 극대화를 통한 마진 확대에 집중",
-            "• 현금 창출 능력 강화로 안정적 배당 및 투자 재원 확보",
-            "",
-            "◆ 중기 전략 (3-5년)", 
-            "• 사업 포트폴리오 다각화 및 신사업 진출 검토",
-            "• 디지털 전환과 공정 혁신을 통한 경쟁력 강화"
-        ]
-        
-        for content in strategy_content:
-            if content.strip():
-                story.append(Paragraph(content, body_style))
-            else:
-                story.append(Spacer(1, 6))
-        
-        # Footer
-        if show_footer:
-            story.append(Spacer(1, 30))
-            footer_style = ParagraphStyle(
-                'Footer',
-                fontName=registered_fonts.get('Korean', 'Helvetica'),
-                fontSize=8,
-                alignment=1,
-                textColor=colors.HexColor('#7F8C8D')
-            )
-            
-            story.append(Paragraph("※ 본 보고서는 AI 분석 시스템에 의해 생성되었습니다", footer_style))
-            story.append(Paragraph(f"생성일시: {datetime.now().strftime('%Y년 %m월 %d일 %H시 %M분')}", footer_style))
-        
-        # PDF 빌드
-        doc.build(story)
-        
-        buffer.seek(0)
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
         # 성공 결과 반환
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"SK에너지_분석보고서_{timestamp}.pdf"
-        
-        data_status = []
-        if has_real_financial:
-            data_status.append("실제 재무데이터")
-        if has_real_news:
-            data_status.append("실제 뉴스데이터")
-        if has_insights:
-            data_status.append("AI 인사이트")
-        
-        message = f"✅ PDF 생성 완료! ({', '.join(data_status) if data_status else '샘플 데이터'} 사용)"
+        filename = f"SK에너지_분석보고서_{file_ts}.pdf"
         
-        print(f"✅ PDF 생성 성공 - {len(pdf_data)} bytes, {message}")
+        _debug_print(f"✅ PDF 생성 성공 - {len(pdf_data)} bytes, {message}")
         
         return {
             'success': True,
@@ -846,6 +1330,84 @@ def generate_pdf_report(
 # 🔧 Excel 보고서 생성
 # ===========================================
 
+# Excel 셀 1개에 들어갈 수 있는 최대 문자 수
+_EXCEL_MAX_CELL_CHARS = 32767
+
+# 실제 재무 데이터가 없을 때 쓰는 샘플 시트 (고정 데이터 - 모듈 로드 시 1회 생성, 읽기 전용으로만 사용)
+# float64 유지: float32로 줄이면 15.2가 15.199999809... 처럼 셀 값이 바뀜
+_SAMPLE_EXCEL_DF = pd.DataFrame({
+    '구분': ['매출액(조원)', '영업이익률(%)', 'ROE(%)', 'ROA(%)'],
+    'SK에너지': [15.2, 5.6, 12.3, 8.1],
+    'S-Oil': [14.8, 5.3, 11.8, 7.8],
+    'GS칼텍스': [13.5, 4.6, 10.5, 7.2],
+    'HD현대오일뱅크': [11.2, 4.3, 9.2, 6.5]
+})
+
+def _excel_cell(value):
+    """object 컬럼 셀 → 엔진이 기록할 수 있는 값 (list/dict 등 비스칼라, ±inf는 to_excel처럼 문자열로)"""
+    if isinstance(value, float):
+        return value if np.isfinite(value) else str(value)
+    if value is None or isinstance(value, str) or pd.api.types.is_scalar(value):
+        return value
+    return str(value)
+
+def _excel_rows(df):
+    """
+    DataFrame → 행 리스트 (결측 → None, Excel 셀 한도를 넘는 문자열은 미리 절단)
+    - xlsxwriter/openpyxl은 list/dict 셀과 ±inf를 거부하므로 to_excel과 같은 문자열("['a']", "inf")로 기록
+    """
+    values = df.astype(object).where(df.notna(), None).to_numpy()
+    for col_pos, dtype in enumerate(df.dtypes):
+        if pd.api.types.is_float_dtype(dtype):
+            # 숫자 컬럼은 ±inf 셀만 찾아 문자열로 변환
+            floats = df.iloc[:, col_pos].to_numpy(dtype=float, na_value=np.nan)
+            for row_pos in np.flatnonzero(np.isinf(floats)):
+                values[row_pos, col_pos] = str(values[row_pos, col_pos])
+            continue
+        if pd.api.types.is_object_dtype(dtype):
+            values[:, col_pos] = [_excel_cell(value) for value in values[:, col_pos]]
+        if not pd.api.types.is_string_dtype(dtype):  # object/str 컬럼만 길이 검사
+            continue
+        try:
+            lengths = pd.Series(values[:, col_pos]).str.len()  # 문자열이 아닌 셀은 NaN
+        except AttributeError:  # 문자열이 하나도 없는 object 컬럼
+            continue
+        # 한도 초과 셀만 골라 절단 (xlsxwriter는 초과 시 오류 코드로 행 기록을 중단함)
+        for row_pos in np.flatnonzero(lengths.gt(_EXCEL_MAX_CELL_CHARS).to_numpy()):
+            values[row_pos, col_pos] = values[row_pos, col_pos][:_EXCEL_MAX_CELL_CHARS]
+    return values.tolist()
+
+def _write_excel_sheet(writer, df, sheet_name):
+    """
+    DataFrame을 시트에 기록 (pandas ExcelFormatter/스타일러를 거치지 않고 엔진에 직접 기록)
+    - xlsxwriter constant_memory 모드는 행 순서대로만 기록 가능
+      (pandas to_excel은 열 단위로 기록하므로 데이터 유실) → 행 단위로 직접 기록
+    - openpyxl 폴백은 write_only 통합문서에 append로 행 단위 기록 (셀 객체 트리 미생성)
+    """
+    header = [str(col) for col in df.columns]
+    rows = _excel_rows(df)
+    
+    if writer.engine == 'xlsxwriter':
+        worksheet = writer.book.add_worksheet(sheet_name)
+        header_format = writer.book.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        worksheet.write_row(0, 0, header, header_format)
+        for row_idx, row in enumerate(rows, 1):
+            worksheet.write_row(row_idx, 0, row)
+        return
+    
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    worksheet = writer.book.create_sheet(sheet_name)
+    header_font = Font(bold=True)
+    header_cells = []
+    for name in header:
+        cell = WriteOnlyCell(worksheet, value=name)
+        cell.font = header_font
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+    for row in rows:
+        worksheet.append(row)
+
 def create_excel_report(
     financial_data=None,
     news_data=None,
@@ -853,60 +1415,113 @@ def create_excel_report(
     **kwargs
 ):
     """Excel 보고서 생성"""
-    print(f"📊 Excel 보고서 생성 시작")
+    _debug_print(f"📊 Excel 보고서 생성 시작")
     
     try:
         # 데이터 수집
-        if financial_data is None or news_data is None:
-            session_financial, session_news, session_insights = get_real_data_from_session()
-            if financial_data is None:
-                financial_data = session_financial
-            if news_data is None:
-                news_data = session_news
-            if not insights:
-                insights = session_insights
+        financial_data, news_data, insights = _resolve_inputs(financial_data, news_data, insights)
         
-        buffer = io.BytesIO()
+        # PDF와 동일하게 스풀 파일에 기록 (getvalue() 전체 복사 없이 크기만큼 한 번에 읽음)
+        buffer = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE)
         
         # 실제 데이터 또는 샘플 데이터 사용
-        if financial_data is not None and not financial_data.empty:
+        if _is_non_empty_df(financial_data):
             sample_data = financial_data
             data_type = "실제 DART 데이터"
         else:
-            sample_data = pd.DataFrame({
-                '구분': ['매출액(조원)', '영업이익률(%)', 'ROE(%)', 'ROA(%)'],
-                'SK에너지': [15.2, 5.6, 12.3, 8.1],
-                'S-Oil': [14.8, 5.3, 11.8, 7.8],
-                'GS칼텍스': [13.5, 4.6, 10.5, 7.2],
-                'HD현대오일뱅크': [11.2, 4.3, 9.2, 6.5]
-            })
+            sample_data = _SAMPLE_EXCEL_DF
             data_type = "샘플 데이터"
         
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+        # xlsxwriter constant_memory: 행을 기록 즉시 zip 스트림으로 내보내 메모리 사용 최소화
+        if XLSXWRITER_AVAILABLE:
+            writer_kwargs = {
+                'engine': 'xlsxwriter',
+                'engine_kwargs': {'options': {
+                    'constant_memory': True,
+                    'strings_to_urls': False,
+                    'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+                }}
+            }
+        else:
+            # write_only: 셀 객체 트리 없이 행을 바로 XML로 기록
+            writer_kwargs = {'engine': 'openpyxl', 'engine_kwargs': {'write_only': True}}
+        
+        with pd.ExcelWriter(buffer, **writer_kwargs) as writer:
             # 재무분석 시트
-            sample_data.to_excel(writer, sheet_name='재무분석', index=False)
+            _write_excel_sheet(writer, sample_data, '재무분석')
             
             # 뉴스 데이터 시트
-            if news_data is not None and not news_data.empty:
-                news_data.to_excel(writer, sheet_name='뉴스분석', index=False)
+            if _is_non_empty_df(news_data):
+                _write_excel_sheet(writer, news_data, '뉴스분석')
             
             # 인사이트 시트
             if insights:
                 insights_df = pd.DataFrame({'인사이트': insights})
-                insights_df.to_excel(writer, sheet_name='AI인사이트', index=False)
+                _write_excel_sheet(writer, insights_df, 'AI인사이트')
         
+        size = buffer.tell()
         buffer.seek(0)
-        excel_data = buffer.getvalue()
+        excel_data = buffer.read(size)
         buffer.close()
         
-        print(f"✅ Excel 생성 완료 ({data_type}) - {len(excel_data)} bytes")
+        _debug_print(f"✅ Excel 생성 완료 ({data_type}) - {len(excel_data)} bytes")
         return excel_data
         
     except Exception as e:
         print(f"❌ Excel 생성 실패: {e}")
         error_msg = f"Excel 생성 실패: {str(e)}"
+        return _create_error_workbook(error_msg)
+
+def _create_error_workbook(error_msg):
+    """
+    오류 메시지 1행짜리 xlsx 생성 (pandas ExcelWriter 없이 xlsxwriter 직접 사용)
+    - xlsxwriter가 없거나 실패하면 기존처럼 메시지 바이트 반환
+    """
+    if not XLSXWRITER_AVAILABLE:
+        return error_msg.encode('utf-8')
+    
+    try:
+        import xlsxwriter
+        buffer = io.BytesIO()
+        workbook = xlsxwriter.Workbook(buffer, {'in_memory': True})
+        worksheet = workbook.add_worksheet('오류')
+        worksheet.write(0, 0, error_msg)
+        workbook.close()
+        return buffer.getvalue()
+    except Exception:
         return error_msg.encode('utf-8')
 
+# ===========================================
+# ⚡ PDF + Excel 일괄 생성
+# ===========================================
+
+def generate_all_reports(
+    financial_data=None,
+    news_data=None,
+    insights=None,
+    **kwargs
+):
+    """
+    PDF와 Excel 보고서를 한 번에 생성
+    - 세션 데이터는 한 번만 수집해 두 보고서에 같은 값을 전달
+    - 스크립트 스레드에서 순차 실행 (세션/캐시 접근에 Streamlit 컨텍스트 필요)
+    - 반환: (PDF 결과 dict, Excel 바이트)
+    """
+    financial_data, news_data, insights = _resolve_inputs(financial_data, news_data, insights)
+    
+    pdf_result = generate_pdf_report(
+        financial_data=financial_data,
+        news_data=news_data,
+        insights=insights,
+        **kwargs
+    )
+    excel_data = create_excel_report(
+        financial_data=financial_data,
+        news_data=news_data,
+        insights=insights
+    )
+    return pdf_result, excel_data
+
 # ===========================================
 # 🎛️ Streamlit 인터페이스 함수들
 # ===========================================
@@ -970,6 +1585,69 @@ def handle_pdf_generation_button(
                     st.code(result['traceback'])
             return False
 
+def handle_all_reports_button(
+    button_clicked,
+    financial_data=None,
+    news_data=None,
+    insights=None,
+    report_target="SK이노베이션 경영진",
+    report_author="AI 분석 시스템",
+    show_footer=True,
+    **kwargs
+):
+    """
+    PDF + Excel 일괄 생성 버튼 처리 (generate_all_reports로 두 보고서를 차례로 생성)
+    """
+    if not button_clicked:
+        return None
+    
+    with st.spinner("PDF와 Excel 보고서를 함께 생성 중..."):
+        pdf_result, excel_data = generate_all_reports(
+            financial_data=financial_data,
+            news_data=news_data,
+            insights=insights,
+            report_target=report_target,
+            report_author=report_author,
+            show_footer=show_footer,
+            **kwargs
+        )
+    
+    if not pdf_result['success']:
+        st.error(f"❌ {pdf_result['error']}")
+        if 'traceback' in pdf_result:
+            with st.expander("상세 오류"):
+                st.code(pdf_result['traceback'])
+        return False
+    
+    excel_filename = f"SK에너지_분석데이터_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+    col_pdf, col_excel = st.columns(2)
+    with col_pdf:
+        st.download_button(
+            label="📥 PDF 다운로드",
+            data=pdf_result['data'],
+            file_name=pdf_result['filename'],
+            mime=pdf_result['mime'],
+            type="secondary",
+            key="all_reports_pdf_download"
+        )
+    with col_excel:
+        st.download_button(
+            label="📥 Excel 다운로드",
+            data=excel_data,
+            file_name=excel_filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            type="secondary",
+            key="all_reports_excel_download"
+        )
+    st.success(pdf_result['message'])
+    
+    # 세션에 저장 (PDF 단독 버튼과 같은 키)
+    st.session_state.generated_file = pdf_result['data']
+    st.session_state.generated_filename = pdf_result['filename']
+    st.session_state.generated_mime = pdf_result['mime']
+    
+    return True
+
 # ===========================================
 # 🔄 기존 함수명 호환성 (메인 코드 연동용)
 # ===========================================
@@ -999,7 +1677,7 @@ def test_integration():
     ]
     
     for func_name in functions_to_test:
-        if func_name in globals():
+        if func_name in _MODULE_FUNCS:
             print(f"✅ {func_name} 함수 존재")
         else:
             print(f"❌ {func_name} 함수 없음")
@@ -1032,8 +1710,66 @@ def test_integration():
     except Exception as e:
         print(f"❌ 폰트 테스트 오류: {e}")
     
+    # 5. 음수/혼합 값 차트 축 테스트 (영업손실, 음수 ROE가 Drawing 밖으로 그려지지 않는지)
+    try:
+        axis_cases = {
+            (-5, -12, 2): (-12 * 1.15, 2 * 1.15),
+            (-5, -12): (-12 * 1.15, 0),
+            (0, 0): (0, 1),
+            (3, 4): (0, 4 * 1.15),
+        }
+        axis_ok = all(
+            all(abs(a - b) < 1e-9 for a, b in zip(_value_axis_bounds(values), expected))
+            for values, expected in axis_cases.items()
+        )
+        bounds_ok = True
+        if _ensure_reportlab():
+            for values in [(-5, -12, 2), (-5, -12)]:
+                drawing = _native_bar_chart(
+                    '음수 테스트', ['A', 'B', 'C'][:len(values)], values, '%s',
+                    ('#E31E24',) * len(values), 'Helvetica', 'Helvetica-Bold', 450, 270
+                )
+                x0, y0, x1, y1 = drawing.getBounds()
+                bounds_ok &= x0 >= 0 and y0 >= 0 and x1 <= drawing.width and y1 <= drawing.height
+        if axis_ok and bounds_ok:
+            print("✅ 음수 값 차트 축 테스트 성공")
+        else:
+            print(f"❌ 음수 값 차트 축 테스트 실패 - 축 범위={axis_ok}, Drawing 범위={bounds_ok}")
+    except Exception as e:
+        print(f"❌ 음수 값 차트 축 테스트 오류: {e}")
+    
+    # 6. Excel 특수 셀 테스트 (list/dict, ±inf 셀이 오류 시트 없이 to_excel과 같은 문자열로 기록되는지)
+    try:
+        special_df = pd.DataFrame({
+            '구분': [['a'], {'k': 1}, 'x'],
+            '값': [np.inf, -np.inf, 1.5],
+        })
+        expected_cells = [["['a']", 'inf'], ["{'k': 1}", '-inf'], ['x', '1.5']]
+        engines = ['xlsxwriter'] if XLSXWRITER_AVAILABLE else []
+        if importlib.util.find_spec("openpyxl") is not None:
+            engines.append('openpyxl')
+        failed = []
+        for engine in engines:
+            buffer = io.BytesIO()
+            engine_kwargs = {'options': {'constant_memory': True}} if engine == 'xlsxwriter' else {'write_only': True}
+            with pd.ExcelWriter(buffer, engine=engine, engine_kwargs=engine_kwargs) as writer:
+                _write_excel_sheet(writer, special_df, '재무분석')
+            buffer.seek(0)
+            cells = pd.read_excel(buffer, sheet_name='재무분석', dtype=str).values.tolist()
+            if cells != expected_cells:
+                failed.append(f"{engine}: {cells}")
+        if failed:
+            print(f"❌ Excel 특수 셀 테스트 실패 - {failed}")
+        else:
+            print(f"✅ Excel 특수 셀 테스트 성공 ({', '.join(engines) or '엔진 없음'})")
+    except Exception as e:
+        print(f"❌ Excel 특수 셀 테스트 오류: {e}")
+    
     print("🏁 통합 테스트 완료")
 
+# 모듈에 정의된 함수 이름 (모든 정의 이후 1회 계산 - test_integration 존재 확인용)
+_MODULE_FUNCS = frozenset(name for name, obj in globals().items() if callable(obj))
+
 # ===========================================
 # 🚀 메인 실행부
 # ===========================================
@@ -1045,39 +1781,37 @@ if __name__ == "__main__":
     # 환경 확인
     print("📋 환경 확인:")
     print(f"  - ReportLab: {'✅' if REPORTLAB_AVAILABLE else '❌'}")
-    print(f"  - 폰트: {'✅ ' + str(len(get_font_paths())) + '개' if get_font_paths() else '❌'}")
+    font_count = len(get_font_paths())
+    print(f"  - 폰트: {'✅ ' + str(font_count) + '개' if font_count else '❌'}")
     
-    # Streamlit 환경 확인
-    try:
-        if 'streamlit' in st.__module__:
-            print("🌐 Streamlit 환경에서 실행")
-            st.title("🏢 SK에너지 분석 보고서 생성기 (정리된 버전)")
-            st.markdown("---")
-            
-            # 기본 정보 입력
-            col1, col2 = st.columns(2)
-            with col1:
-                report_target = st.text_input("보고 대상", value="SK이노베이션 경영진")
-            with col2:
-                report_author = st.text_input("보고자", value="AI 분석 시스템")
-            
-            # PDF 생성 버튼
-            if st.button("📄 PDF 보고서 생성", type="primary"):
-                success = handle_pdf_generation_button(
-                    button_clicked=True,
-                    report_target=report_target,
-                    report_author=report_author
-                )
-            
-            # 테스트 버튼
-            if st.button("🧪 통합 테스트"):
-                with st.spinner("테스트 중..."):
-                    test_integration()
-                    st.success("✅ 테스트 완료! 콘솔 확인")
-        else:
-            print("💻 일반 Python 환경에서 실행")
-            test_integration()
-    except:
+    # Streamlit 환경 확인 (streamlit run으로 실행될 때만 스크립트 실행 컨텍스트가 존재)
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    if get_script_run_ctx() is not None:
+        print("🌐 Streamlit 환경에서 실행")
+        st.title("🏢 SK에너지 분석 보고서 생성기 (정리된 버전)")
+        st.markdown("---")
+        
+        # 기본 정보 입력
+        col1, col2 = st.columns(2)
+        with col1:
+            report_target = st.text_input("보고 대상", value="SK이노베이션 경영진")
+        with col2:
+            report_author = st.text_input("보고자", value="AI 분석 시스템")
+        
+        # PDF 생성 버튼
+        if st.button("📄 PDF 보고서 생성", type="primary"):
+            success = handle_pdf_generation_button(
+                button_clicked=True,
+                report_target=report_target,
+                report_author=report_author
+            )
+        
+        # 테스트 버튼
+        if st.button("🧪 통합 테스트"):
+            with st.spinner("테스트 중..."):
+                test_integration()
+                st.success("✅ 테스트 완료! 콘솔 확인")
+    else:
         print("💻 일반 Python 환경에서 실행")
         test_integration()
     